@@ -2,9 +2,9 @@ import json
 import re
 import difflib
 import unicodedata
-import time
 from functools import lru_cache
 from minim import tidal
+from requests.adapters import HTTPAdapter, Retry
 from musixporter.interfaces import IdConverter
 
 # Optional rich for improved console output
@@ -35,6 +35,14 @@ except Exception:
     HAS_RICH = False
     console = None
 
+# Optional orjson for faster JSON dumps
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except Exception:
+    HAS_ORJSON = False
+
 
 class TidalMapper(IdConverter):
     API_KEYS = [
@@ -73,6 +81,7 @@ class TidalMapper(IdConverter):
                     client_id=key["id"],
                     client_secret=key["secret"],
                 )
+                self._mount_http_adapter(client)
                 self.client = client
 
             except Exception as e:
@@ -87,6 +96,22 @@ class TidalMapper(IdConverter):
                     )
                 continue
 
+    def _mount_http_adapter(self, client):
+        # Keep-alive pool + retry on throttled / transient responses for the
+        # many sequential search calls. The last response is handed back to
+        # minim (raise_on_status=False) so its own error handling still runs.
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        client.session.mount("https://", adapter)
+
     # ----------------------------
     # Utilities
     # ----------------------------
@@ -374,8 +399,6 @@ class TidalMapper(IdConverter):
                             task,
                             description=f"Mapping Tracks ({i+1}/{total}) Matches: {success}",
                         )
-                    if i % 10 == 0:
-                        time.sleep(0.01)
         else:
             print(f"[Tidal] Mapping {total} Tracks...")
             for i, t in enumerate(tracks_in):
@@ -419,7 +442,6 @@ class TidalMapper(IdConverter):
                             task_a,
                             description=f"Mapping Albums ({i}/{len(albums_in)}) {title}",
                         )
-                    time.sleep(0.05)
         else:
             print(f"[Tidal] Mapping {len(albums_in)} Albums...")
             for i, a in enumerate(albums_in, start=1):
@@ -518,8 +540,12 @@ class TidalMapper(IdConverter):
         if missed:
             # 1. Save full detailed log to file (includes duplicates if real)
             try:
-                with open("missed_tidal.json", "w", encoding="utf-8") as mf:
-                    json.dump(missed, mf, indent=2, ensure_ascii=False)
+                if HAS_ORJSON:
+                    with open("missed_tidal.json", "wb") as mf:
+                        mf.write(orjson.dumps(missed, option=orjson.OPT_INDENT_2))
+                else:
+                    with open("missed_tidal.json", "w", encoding="utf-8") as mf:
+                        json.dump(missed, mf, indent=2, ensure_ascii=False)
                 file_msg = "details saved to missed_tidal.json"
             except Exception:
                 file_msg = "could not write missed_tidal.json"
@@ -2,6 +2,12 @@ import json
 from datetime import datetime
 from musixporter.interfaces import OutputFormatter
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except Exception:
+    HAS_ORJSON = False
+
 class MonochromeJsonOutput(OutputFormatter):
     def _format_date(self, timestamp):
         try:
@@ -49,8 +55,12 @@ class MonochromeJsonOutput(OutputFormatter):
                 "tracks": [self._fmt_t(t) for t in pl['tracks']]
             })
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(out, f, indent=2)
+        if HAS_ORJSON:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(out, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(out, f, indent=2)
         print("Done.")
 
     def _fmt_t(self, t):
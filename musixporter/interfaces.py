@@ -6,6 +6,13 @@ class InputSource(abc.ABC):
     @abc.abstractmethod
     def fetch_data(self) -> dict: pass
 
+    def close(self):
+        """Release network resources held by the source."""
+        pass
+
+    def __enter__(self): return self
+    def __exit__(self, *exc_info): self.close()
+
 class OutputFormatter(abc.ABC):
     @abc.abstractmethod
     def save(self, data: dict, filename: str): pass
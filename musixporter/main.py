@@ -33,6 +33,11 @@ def main():
         default=None,
         help="(YouTube) public playlist id to fetch (unauthenticated)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="(YouTube) don't read or write the on-disk response cache",
+    )
     parser.add_argument(
         "--playlist-id",
         default=None,
@@ -69,6 +74,7 @@ def main():
                 auth_headers_path=args.yt_headers,
                 playlist_id=args.yt_playlist,
                 user=args.user_id,
+                use_cache=not args.no_cache,
             )
         elif args.source == "deezer":
             source = get_source(
@@ -87,8 +93,9 @@ def main():
     formatter = MonochromeJsonOutput()
 
     try:
-        source.authenticate()
-        data = source.fetch_data()
+        with source:
+            source.authenticate()
+            data = source.fetch_data()
 
         info("\n--- Phase 2: Converting IDs to Tidal ---")
         tidal_data = converter.convert(data)
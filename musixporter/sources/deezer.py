@@ -1,25 +1,130 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import threading
 import time
+from urllib.parse import parse_qs, urlparse
 
 from musixporter.interfaces import InputSource
 from musixporter.console import info, warn
 
 import deezer
+import httpx
 
-from limits import RateLimitItemPerSecond
-from limits.storage import MemoryStorage
-from limits.strategies import MovingWindowRateLimiter
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except Exception:
+    HAS_ORJSON = False
+
+
+class _MovingWindowLimiter:
+    """In-process moving-window rate limiter on the monotonic clock.
+
+    Keeps the timestamps of the hits in the current window, so wall-clock
+    adjustments (NTP jumps) can't cause negative or oversized sleeps.
+    """
+
+    def __init__(self, limit: int, period: float):
+        self.limit = limit
+        self.period = period
+        self._hits = deque()
+
+    def hit(self, now: float) -> bool:
+        """Record one hit at `now` if the window has room for it."""
+        hits = self._hits
+        cutoff = now - self.period
+        while hits and hits[0] <= cutoff:
+            hits.popleft()
+        if len(hits) < self.limit:
+            hits.append(now)
+            return True
+        return False
+
+    def reset_time(self) -> float:
+        """Monotonic time at which the oldest hit leaves the window."""
+        return self._hits[0] + self.period
 
 
 # Deezer API quota: 50 requests / 5 seconds.
 # We use a moving-window limiter so we don't exceed this in any rolling 5s window.
-_DEEZER_RATE_LIMIT_ITEM = RateLimitItemPerSecond(50, 5, namespace="DEEZER")
-_DEEZER_RATE_LIMIT_STORAGE = MemoryStorage()
-_DEEZER_RATE_LIMITER = MovingWindowRateLimiter(_DEEZER_RATE_LIMIT_STORAGE)
+_DEEZER_RATE_LIMITER = _MovingWindowLimiter(50, 5)
 _DEEZER_RATE_LIMIT_LOCK = threading.Lock()
 
+# Keep-alive pool sized for the 50-request burst, and retry policy for
+# throttled / transient responses (exponential backoff: 0.5s, 1s, 2s).
+_DEEZER_POOL_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=10)
+_DEEZER_RETRY_TOTAL = 3
+_DEEZER_RETRY_BACKOFF = 0.5
+_DEEZER_RETRY_STATUSES = frozenset({429, 502, 503})
+
+# Number of playlists fetched concurrently.
+_DEEZER_PLAYLIST_WORKERS = 4
+
+# Pagination: items per page, and pages fetched concurrently once the
+# total is known from the first page.
+_DEEZER_PAGE_SIZE = 100
+_DEEZER_PAGE_WORKERS = 4
+
+# Field projections (`?fields=`) matching what the normalizers below read.
+# `type` is kept so deezer-python still builds typed resources.
+_TRACK_FIELDS = (
+    "id,type,isrc,title,duration,explicit_lyrics,time_add,"
+    "artist(id,type,name),album(id,type,title,cover)"
+)
+_ALBUM_FIELDS = (
+    "id,type,title,time_add,release_date,cover,nb_tracks,artist(id,type,name)"
+)
+_ARTIST_FIELDS = "id,type,name"
+
+
+class _OrjsonResponse(httpx.Response):
+    """httpx response decoding JSON bodies with orjson (straight from bytes)."""
+
+    def json(self, **kwargs):
+        return orjson.loads(self.content)
+
+
+class _RateLimitedTransport(httpx.BaseTransport):
+    """Transport wrapper that waits for Deezer quota before every request.
+
+    Every call made through the client (including pagination and resource
+    relations) goes through `handle_request` of whichever transport serves the
+    URL, so each of them is wrapped and the quota check lives in one place.
+    Responses with a retryable status are retried with backoff, and JSON
+    decoding goes through orjson when it is installed.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, wait_for_quota):
+        self._transport = transport
+        self._wait_for_quota = wait_for_quota
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(_DEEZER_RETRY_TOTAL + 1):
+            self._wait_for_quota()
+            response = self._transport.handle_request(request)
+            if (
+                response.status_code not in _DEEZER_RETRY_STATUSES
+                or attempt == _DEEZER_RETRY_TOTAL
+            ):
+                break
+            response.close()
+            time.sleep(_DEEZER_RETRY_BACKOFF * (2 ** attempt))
+
+        if not HAS_ORJSON:
+            return response
+        return _OrjsonResponse(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=response.stream,
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        self._transport.close()
+
 
 class DeezerUserSource(InputSource):
     """
@@ -50,7 +155,7 @@ class DeezerUserSource(InputSource):
             )
 
         self.client = deezer.Client(access_token=access_token)
-        self._wrap_rate_limited_client()
+        self._mount_rate_limited_transport()
 
     # -------------------------
     # Public API
@@ -63,6 +168,10 @@ class DeezerUserSource(InputSource):
         if not self.user_id:
             return
 
+        # Playlist-only runs never touch the user profile, don't spend quota on it.
+        if self.playlist_id:
+            return
+
         info("[Deezer] Validating user…")
         try:
             self.user = self.client.get_user(self.user_id)
@@ -73,19 +182,20 @@ class DeezerUserSource(InputSource):
             f"[Deezer] Using public profile: {self.user.name} (ID: {self.user_id})"
         )
 
+    def close(self):
+        """Close the HTTP client and its pooled connections."""
+        self.client.close()
+
     def fetch_data(self) -> dict:
         if self.playlist_id:
             info("[Deezer] Fetching playlist…")
             playlist = self._fetch_playlist_by_id(self.playlist_id)
 
-            info("[Deezer] Normalizing data…")
-
-            playlists = [playlist] if playlist else []
             return {
                 "tracks": [],
                 "albums": [],
                 "artists": [],
-                "user_playlists": [self._normalize_playlist(p) for p in playlists],
+                "user_playlists": [playlist] if playlist else [],
             }
 
         if not self.user_id:
@@ -98,40 +208,42 @@ class DeezerUserSource(InputSource):
 
         info("[Deezer] Fetching library…")
 
-        tracks = self._fetch_favorite_tracks()
-        albums = self._fetch_favorite_albums()
-        artists = self._fetch_favorite_artists()
-        playlists = self._fetch_user_playlists()
-
-        info("[Deezer] Normalizing data…")
+        # Fetchers normalize while paginating, so raw resources are never
+        # copied into a second full-size list. The four sections are
+        # independent: run them concurrently so their latencies overlap.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            tracks = executor.submit(self._fetch_favorite_tracks)
+            albums = executor.submit(self._fetch_favorite_albums)
+            artists = executor.submit(self._fetch_favorite_artists)
+            playlists = executor.submit(self._fetch_user_playlists)
 
-        return {
-            "tracks": [self._normalize_track(t) for t in tracks],
-            "albums": [self._normalize_album(a) for a in albums],
-            "artists": [self._normalize_artist(a) for a in artists],
-            "user_playlists": [self._normalize_playlist(p) for p in playlists],
-        }
+            return {
+                "tracks": tracks.result(),
+                "albums": albums.result(),
+                "artists": artists.result(),
+                "user_playlists": playlists.result(),
+            }
 
     # -------------------------
     # Rate limiting
     # -------------------------
 
-    def _wait_for_deezer_quota(self, identifier: str = "deezer") -> None:
+    def _wait_for_deezer_quota(self) -> None:
         """Blocks until we're allowed to perform one Deezer API call.
 
         Note: This guarantees rate-limiting only within the current Python process.
         """
+        _sleep = time.sleep
+        _mono = time.monotonic
+        hit = _DEEZER_RATE_LIMITER.hit
+        reset_time = _DEEZER_RATE_LIMITER.reset_time
+
         with _DEEZER_RATE_LIMIT_LOCK:
             # warned = False
-            while not _DEEZER_RATE_LIMITER.hit(
-                _DEEZER_RATE_LIMIT_ITEM, identifier
-            ):
-                window_stats = _DEEZER_RATE_LIMITER.get_window_stats(
-                    _DEEZER_RATE_LIMIT_ITEM, identifier
-                )
-                sleep_seconds = (
-                    max(0.0, window_stats.reset_time - time.time()) + 0.05
-                )
+            while not hit(_mono()):
+                # Wait until the oldest hit leaves the window, then re-check
+                # with a single hit().
+                sleep_seconds = max(0.0, reset_time() - _mono()) + 0.05
 
                 # if not warned:
                 #     info(
@@ -139,39 +251,93 @@ class DeezerUserSource(InputSource):
                 #     )
                 #     warned = True
 
-                time.sleep(sleep_seconds)
+                _sleep(sleep_seconds)
 
-    def _wrap_rate_limited_client(self) -> None:
-        """Wrap the underlying HTTP calls so *all* Deezer requests are rate-limited.
+    def _mount_rate_limited_transport(self) -> None:
+        """Route *all* Deezer requests through rate-limited transports.
 
-        This includes pagination and resource methods that call back into the client.
+        deezer-python's `Client` is an `httpx.Client` that does not expose its
+        transports, so they are wrapped after construction: the default one
+        (replaced by a pooled transport) and every mount, since httpx serves
+        proxied URLs (e.g. from HTTPS_PROXY) from its mounts instead.
         """
-        if getattr(self.client, "_musixporter_rate_limited", False):
-            return
-
-        original_request = self.client.request
-        original_get = self.client.get
-
-        def rate_limited_request(*args, **kwargs):
-            self._wait_for_deezer_quota()
-            return original_request(*args, **kwargs)
+        client = self.client
+        wait = self._wait_for_deezer_quota
 
-        def rate_limited_get(*args, **kwargs):
-            self._wait_for_deezer_quota()
-            return original_get(*args, **kwargs)
+        if not isinstance(client._transport, _RateLimitedTransport):
+            client._transport.close()
+            client._transport = _RateLimitedTransport(
+                httpx.HTTPTransport(limits=_DEEZER_POOL_LIMITS), wait
+            )
 
-        self.client.request = rate_limited_request
-        self.client.get = rate_limited_get
-        self.client._musixporter_rate_limited = True
+        client._mounts = {
+            pattern: (
+                transport
+                if transport is None or isinstance(transport, _RateLimitedTransport)
+                else _RateLimitedTransport(transport, wait)
+            )
+            for pattern, transport in client._mounts.items()
+        }
 
     # -------------------------
     # Fetchers
     # -------------------------
 
+    def _fetch_pages(self, path: str, fields: str, normalize) -> list:
+        """All items of the paginated `path`, normalized page by page.
+
+        Only the given fields are requested. The first page reports the total
+        and, through the `index` of its `next` link, the page stride, so the
+        remaining pages are known up-front and fetched concurrently (the
+        transport keeps the quota). The stride is taken from `next` rather
+        than from the items served: Deezer may drop unavailable items from a
+        page while still counting them. Each page is normalized as soon as it
+        arrives, so raw resources never pile up.
+        """
+        params = {"fields": fields, "limit": _DEEZER_PAGE_SIZE}
+        first = self.client.request("GET", path, paginate_list=True, params=params)
+        items = [normalize(x) for x in first["data"]]
+
+        next_url = first.get("next")
+        step = _DEEZER_PAGE_SIZE
+        if next_url:
+            try:
+                step = int(parse_qs(urlparse(next_url).query)["index"][0]) or step
+            except (KeyError, IndexError, ValueError):
+                pass
+
+        total = first.get("total")
+        if total is None:
+            # No total to plan with: follow the `next` links sequentially.
+            while next_url:
+                url_bits = urlparse(next_url)
+                page = self.client.request(
+                    "GET",
+                    url_bits.path.lstrip("/"),
+                    paginate_list=True,
+                    params=parse_qs(url_bits.query),
+                )
+                items.extend(normalize(x) for x in page["data"])
+                next_url = page.get("next")
+            return items
+
+        def fetch_page(index):
+            page = self.client.request(
+                "GET", path, paginate_list=True, params={**params, "index": index}
+            )
+            return [normalize(x) for x in page["data"]]
+
+        with ThreadPoolExecutor(max_workers=_DEEZER_PAGE_WORKERS) as executor:
+            for page in executor.map(fetch_page, range(step, total, step)):
+                items.extend(page)
+        return items
+
     def _fetch_favorite_tracks(self):
         info("   → Favorite tracks")
         try:
-            return list(self.client.get_user_tracks(self.user_id))
+            return self._fetch_pages(
+                f"user/{self.user_id}/tracks", _TRACK_FIELDS, self._normalize_track
+            )
         except Exception as e:
             warn(f"[Deezer] Failed to fetch favorite tracks: {e}")
             return []
@@ -179,7 +345,9 @@ class DeezerUserSource(InputSource):
     def _fetch_favorite_albums(self):
         info("   → Favorite albums")
         try:
-            return list(self.client.get_user_albums(self.user_id))
+            return self._fetch_pages(
+                f"user/{self.user_id}/albums", _ALBUM_FIELDS, self._normalize_album
+            )
         except Exception as e:
             warn(f"[Deezer] Failed to fetch albums: {e}")
             return []
@@ -187,38 +355,39 @@ class DeezerUserSource(InputSource):
     def _fetch_favorite_artists(self):
         info("   → Favorite artists")
         try:
-            return list(self.client.get_user_artists(self.user_id))
+            return self._fetch_pages(
+                f"user/{self.user_id}/artists", _ARTIST_FIELDS, self._normalize_artist
+            )
         except Exception as e:
             warn(f"[Deezer] Failed to fetch artists: {e}")
             return []
 
     def _fetch_user_playlists(self):
         info("   → User playlists")
-        playlists = []
 
         try:
-            raw_playlists = self.user.get_playlists()
+            # iter(): list() on the PaginatedList itself would call __len__,
+            # which costs an extra `total` request.
+            raw_playlists = list(iter(self.user.get_playlists()))
         except Exception as e:
             warn(f"[Deezer] Failed to fetch playlists: {e}")
-            return playlists
-
-        for pl in raw_playlists:
-            try:
-                tracks = list(pl.get_tracks())
-            except Exception:
-                tracks = []
-
-            playlists.append(
-                {
-                    "id": pl.id,
-                    "title": pl.title,
-                    "creation_date": getattr(pl, "creation_date", 0),
-                    "picture": pl.picture,
-                    "tracks": tracks,
-                }
-            )
+            return []
 
-        return playlists
+        # Playlists are independent, latency-bound chains of paginated
+        # requests: overlap them. The shared transport keeps the quota.
+        with ThreadPoolExecutor(max_workers=_DEEZER_PLAYLIST_WORKERS) as executor:
+            return list(executor.map(self._build_user_playlist, raw_playlists))
+
+    def _build_user_playlist(self, pl):
+        return self._normalize_playlist(
+            {
+                "id": pl.id,
+                "title": pl.title,
+                "creation_date": getattr(pl, "creation_date", 0),
+                "picture": pl.picture,
+                "tracks": self._fetch_playlist_tracks(pl),
+            }
+        )
 
     def _fetch_playlist_by_id(self, playlist_id: str):
         info("   → Playlist")
@@ -228,24 +397,32 @@ class DeezerUserSource(InputSource):
             warn(f"[Deezer] Failed to fetch playlist {playlist_id}: {e}")
             return None
 
+        return self._normalize_playlist(
+            {
+                "id": getattr(pl, "id", playlist_id),
+                "title": getattr(pl, "title", str(playlist_id)),
+                "creation_date": getattr(pl, "creation_date", 0),
+                "picture": getattr(pl, "picture", None),
+                "tracks": self._fetch_playlist_tracks(pl),
+            }
+        )
+
+    def _fetch_playlist_tracks(self, pl):
         try:
-            tracks = list(pl.get_tracks())
+            return self._fetch_pages(
+                f"playlist/{pl.id}/tracks", _TRACK_FIELDS, self._normalize_track
+            )
         except Exception:
-            tracks = []
-
-        return {
-            "id": getattr(pl, "id", playlist_id),
-            "title": getattr(pl, "title", str(playlist_id)),
-            "creation_date": getattr(pl, "creation_date", 0),
-            "picture": getattr(pl, "picture", None),
-            "tracks": tracks,
-        }
+            return []
 
     # -------------------------
     # Normalizers
     # -------------------------
 
     def _normalize_track(self, t):
+        # Read each relation once: a missing one may trigger a lazy fetch.
+        artist = t.artist
+        album = t.album
         return {
             "id": t.id,
             "isrc": getattr(t, "isrc", None),
@@ -254,28 +431,31 @@ class DeezerUserSource(InputSource):
             "explicit": bool(t.explicit_lyrics),
             "version": "",
             "date_add": getattr(t, "time_add", 0),
-            "artist": {
-                "id": t.artist.id if t.artist else None,
-                "name": t.artist.name if t.artist else None,
-            },
-            "album": {
-                "id": t.album.id if t.album else None,
-                "title": t.album.title if t.album else None,
-                "cover": t.album.cover if t.album else None,
-            },
+            "artist": (
+                {"id": artist.id, "name": artist.name}
+                if artist
+                else {"id": None, "name": None}
+            ),
+            "album": (
+                {"id": album.id, "title": album.title, "cover": album.cover}
+                if album
+                else {"id": None, "title": None, "cover": None}
+            ),
         }
 
     def _normalize_album(self, a):
+        artist = a.artist
         return {
             "id": a.id,
             "title": a.title,
             "date_add": getattr(a, "time_add", 0),
             "release_date": a.release_date,
             "cover": a.cover,
-            "artist": {
-                "id": a.artist.id if a.artist else None,
-                "name": a.artist.name if a.artist else None,
-            },
+            "artist": (
+                {"id": artist.id, "name": artist.name}
+                if artist
+                else {"id": None, "name": None}
+            ),
             "nb_tracks": a.nb_tracks,
         }
 
@@ -291,5 +471,5 @@ class DeezerUserSource(InputSource):
             "title": p["title"],
             "creation_date": p["creation_date"],
             "cover": p["picture"],
-            "tracks": [self._normalize_track(t) for t in p["tracks"]],
+            "tracks": p["tracks"],
         }
@@ -1,18 +1,27 @@
 """Source factory: dynamically discover available InputSource implementations.
 
 Discovery strategy:
-- Import all modules in the `musixporter.sources` package (skips subpackages).
+- Scan all modules in the `musixporter.sources` package (skips subpackages)
+  without importing them: each module's source is parsed with `ast`.
 - For each module, find classes that subclass `InputSource` and register them
-  under the module name (e.g., `deezer`, `youtube_music`).
+  under the module name (e.g., `deezer`, `youtube_music`), or under their
+  `SOURCE_KEY` class attribute when it is a string literal. Subclasses of
+  other sources count too: bases are matched by name against `InputSource`
+  and every source class found so far, across all scanned modules. A
+  subclass without its own literal `SOURCE_KEY` is registered under its
+  module name (the key is not inherited).
+- A source module (and its heavy third-party dependencies) is only imported
+  when `get_source` is called for it.
 
 This keeps `main.py` source-agnostic: adding a new file in `musixporter/sources`
 exposes the source automatically.
 """
 
+import ast
 import pkgutil
 import importlib
-import inspect
-from typing import Dict, Type
+import importlib.util
+from typing import Dict, Iterator, Optional, Set, Tuple, Type
 
 from musixporter.interfaces import InputSource
 
@@ -27,39 +36,99 @@ def _iter_source_modules(package_name: str):
         yield f"{package_name}.{name}", name
 
 
+def _base_name(node: ast.expr) -> str:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return ""
+
+
+def _scan_classes(full_mod: str) -> Iterator[Tuple[str, Optional[str], Set[str]]]:
+    """Yield `(class_name, SOURCE_KEY or None, base_names)` for a module."""
+    spec = importlib.util.find_spec(full_mod)
+    source = spec.loader.get_source(full_mod) if spec and spec.loader else None
+    if not source:
+        return
+
+    for node in ast.parse(source).body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+
+        key = None
+        for stmt in node.body:
+            if (
+                isinstance(stmt, ast.Assign)
+                and any(
+                    isinstance(t, ast.Name) and t.id == "SOURCE_KEY"
+                    for t in stmt.targets
+                )
+                and isinstance(stmt.value, ast.Constant)
+                and isinstance(stmt.value.value, str)
+            ):
+                key = stmt.value.value
+        yield node.name, key, {_base_name(b) for b in node.bases}
+
+
 def discover_sources(
     package_name: str = "musixporter.sources",
-) -> Dict[str, Type[InputSource]]:
-    sources: Dict[str, Type[InputSource]] = {}
+) -> Dict[str, Tuple[str, str]]:
+    """Map source keys to `(module, class_name)` without importing modules."""
+    classes = []
     for full_mod, short_name in _iter_source_modules(package_name):
         try:
-            mod = importlib.import_module(full_mod)
+            found = list(_scan_classes(full_mod))
         except Exception as e:
-            print(f"Warning: failed to import source module {full_mod}: {e}")
+            print(f"Warning: failed to scan source module {full_mod}: {e}")
             continue
-
-        for _, obj in inspect.getmembers(mod, inspect.isclass):
-            try:
-                if issubclass(obj, InputSource) and obj is not InputSource:
-                    key = getattr(obj, "SOURCE_KEY", short_name)
-                    sources[key] = obj
-            except Exception:
-                continue
-
+        for class_name, key, bases in found:
+            classes.append((full_mod, key or short_name, class_name, bases))
+
+    # Grow the set of source class names until no new subclass shows up.
+    source_names = {InputSource.__name__}
+    changed = True
+    while changed:
+        changed = False
+        for _, _, class_name, bases in classes:
+            if class_name not in source_names and bases & source_names:
+                source_names.add(class_name)
+                changed = True
+
+    sources: Dict[str, Tuple[str, str]] = {}
+    for full_mod, key, class_name, _ in classes:
+        if class_name != InputSource.__name__ and class_name in source_names:
+            sources[key] = (full_mod, class_name)
     return sources
 
 
 _SOURCES = discover_sources()
+_LOADED: Dict[str, Type[InputSource]] = {}
 
 
 def list_sources():
     return list(_SOURCES.keys())
 
 
+def _load_source_class(key: str) -> Type[InputSource]:
+    cls = _LOADED.get(key)
+    if cls is not None:
+        return cls
+
+    full_mod, class_name = _SOURCES[key]
+    try:
+        mod = importlib.import_module(full_mod)
+    except Exception as e:
+        print(f"Warning: failed to import source module {full_mod}: {e}")
+        raise KeyError(f"Source '{key}' is unavailable: {e}") from e
+
+    cls = getattr(mod, class_name)
+    _LOADED[key] = cls
+    return cls
+
+
 def get_source(key: str, **kwargs) -> InputSource:
-    cls = _SOURCES.get(key)
-    if not cls:
+    if key not in _SOURCES:
         raise KeyError(
             f"Unknown source '{key}'. Available: {', '.join(list_sources())}"
         )
-    return cls(**kwargs)
+    return _load_source_class(key)(**kwargs)
@@ -5,17 +5,69 @@ that fetches public or (optionally) authenticated YouTube Music data using
 `ytmusicapi` and normalizes it to the internal schema expected by converters.
 """
 
-from typing import Optional, Dict, Any, List
-from ytmusicapi import YTMusic
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Dict,
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+)
+from requests.exceptions import RequestException
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except Exception:
+    HAS_ORJSON = False
+
+if TYPE_CHECKING:
+    from ytmusicapi import YTMusic
 
 from musixporter.interfaces import InputSource
 from musixporter.console import info, warn
 
+# Playlist id under which YouTube Music lists the user's liked songs.
+_LIKED_SONGS_PLAYLIST_ID = "LM"
 
+# Keys that may carry a playlist's date, by preference.
+_PLAYLIST_DATE_KEYS = ("published", "publishedAt", "lastUpdated")
+
+# Listing fields that change when a playlist is edited (cache revalidation).
+_PLAYLIST_VERSION_KEYS = ("lastUpdated", "count")
+
+
+@lru_cache(maxsize=8192)
 def _parse_duration(dur_str: Optional[str]) -> int:
     """Convert duration like '3:45' or '1:02:30' to seconds."""
     if not dur_str:
         return 0
+
+    # Fast paths for the usual M:SS / H:MM:SS shapes, picked by colon count.
+    try:
+        colons = dur_str.count(":")
+        if colons == 1:
+            m, s = dur_str.split(":")
+            return int(m) * 60 + int(s)
+        if colons == 2:
+            h, m, s = dur_str.split(":")
+            return int(h) * 3600 + int(m) * 60 + int(s)
+    except ValueError:
+        return 0
+
     parts = dur_str.split(":")
     try:
         parts = [int(p) for p in parts]
@@ -28,38 +80,266 @@ def _parse_duration(dur_str: Optional[str]) -> int:
     return seconds
 
 
+def _first_value(d: Dict[str, Any], keys: Tuple[str, ...], default: Any = 0) -> Any:
+    """Return the first truthy `d[key]` among `keys`, else `default`."""
+    return next((v for k in keys if (v := d.get(k))), default)
+
+
+def _normalize_tracks_bulk(raw_tracks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Normalize raw ytmusicapi track items to the internal track schema.
+
+    One comprehension over the whole list, with the duration parser bound to
+    a local, instead of a method call per track. Tracks by the same artist
+    share a single (read-only) artist dict.
+    """
+    parse = _parse_duration
+    artist_cache: Dict[str, Dict[str, Any]] = {}
+
+    def artist(it: Dict[str, Any]) -> Dict[str, Any]:
+        artists = it.get("artists")
+        name = artists[0].get("name") if artists else "Unknown"
+        obj = artist_cache.get(name)
+        if obj is None:
+            obj = artist_cache[name] = {"id": 0, "name": name}
+        return obj
+
+    return [
+        {
+            "id": it.get("videoId") or it.get("playlistItemId") or 0,
+            "title": it.get("title", ""),
+            "duration": parse(it.get("length")),
+            "artist": artist(it),
+            "date_add": None,
+        }
+        for it in raw_tracks
+    ]
+
+
+# On-disk cache of raw get_playlist responses, so re-runs (e.g. after a
+# transient failure) skip the network for playlists fetched recently. Only
+# playlists whose listing provides `lastUpdated` / `count` are cached, keyed by
+# those values so an edited playlist misses the cache; others (the requested
+# public playlist, user playlists) have no way to detect edits and are always
+# fetched. Liked songs change too often to be cached.
+_CACHE_DIR = Path.home() / ".cache" / "musixporter" / "ytmusic"
+_CACHE_TTL_SECONDS = 24 * 3600
+
+# YouTube Music intermittently throttles (429), fails (5xx, connection
+# errors) or returns responses missing expected keys; such calls are retried
+# with exponential backoff plus jitter: with 3 attempts, ~0.5s then ~1s
+# (each backoff step is capped at 4s).
+_RETRY_ATTEMPTS = 3
+_RETRY_INITIAL = 0.5
+_RETRY_MAX = 4.0
+# A 429/503 Retry-After header is honored, up to this many seconds.
+_RETRY_AFTER_MAX = 60.0
+_RETRY_EXCEPTIONS = (RequestException, KeyError)
+_HTTP_STATUS = re.compile(r"HTTP (\d{3})")
+
+
+@lru_cache(maxsize=None)
+def _client_class() -> type:
+    """Return the YTMusic client class, importing ytmusicapi on first use.
+
+    ytmusicapi is only needed once the source actually authenticates, so
+    merely importing this module (or listing sources) stays cheap.
+    """
+    from ytmusicapi import YTMusic
+    from ytmusicapi.constants import YTM_BASE_API
+    from ytmusicapi.exceptions import YTMusicServerError
+
+    class _YTMusicClient(YTMusic):
+        """`YTMusic` with a faster parser and HTTP details on errors.
+
+        Same request and error handling as `YTMusic._send_request`, except
+        that responses are decoded with orjson when installed, and a raised
+        `YTMusicServerError` carries `status_code` and `retry_after` (the
+        Retry-After header) for the retry helper.
+        """
+
+        def _send_request(
+            self, endpoint: str, body: Dict, additionalParams: str = ""
+        ) -> Dict:
+            body.update(self.context)
+
+            response = self._session.post(
+                YTM_BASE_API + endpoint + self.params + additionalParams,
+                json=body,
+                headers=self.headers,
+                proxies=self.proxies,
+                cookies=self.cookies,
+            )
+            if HAS_ORJSON:
+                response_json = orjson.loads(response.content)
+            else:
+                response_json = json.loads(response.text)
+            if response.status_code >= 400:
+                message = (
+                    f"Server returned HTTP {response.status_code}: "
+                    f"{response.reason}.\n"
+                )
+                error = response_json.get("error", {}).get("message")
+                exc = YTMusicServerError(message + error)
+                exc.status_code = response.status_code
+                exc.retry_after = response.headers.get("Retry-After")
+                raise exc
+            return response_json
+
+    return _YTMusicClient
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Whether a failed ytmusicapi call is worth retrying."""
+    if isinstance(exc, _RETRY_EXCEPTIONS):
+        return True
+
+    from ytmusicapi.exceptions import YTMusicServerError
+
+    if not isinstance(exc, YTMusicServerError):
+        return False
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        # Plain ytmusicapi reports HTTP errors only through the message.
+        m = _HTTP_STATUS.search(str(exc))
+        status = int(m[1]) if m else 0
+    return status == 429 or 500 <= status < 600
+
+
+def _retry_after(exc: BaseException) -> float:
+    """Seconds asked for by the error's Retry-After header (0 if none)."""
+    try:
+        return min(float(getattr(exc, "retry_after", None) or 0), _RETRY_AFTER_MAX)
+    except ValueError:
+        # HTTP-date form: fall back to the regular backoff.
+        return 0.0
+
+
+class _CachedYTMusic:
+    """Proxy around `YTMusic` memoizing `get_playlist` on disk.
+
+    Entries are JSON files keyed by a hash of the method name and arguments
+    (plus a namespace, so authenticated and public responses never mix, and
+    the `cache_tag` keyword, which is not forwarded) and expire after `ttl`
+    seconds; expired files are pruned when the proxy is created. Caching is
+    opt-in per call: without a `cache_tag` the call goes straight through.
+    Any other attribute goes straight to the wrapped client.
+    """
+
+    CACHED_METHODS = frozenset({"get_playlist"})
+
+    def __init__(
+        self,
+        client: "YTMusic",
+        namespace: str = "",
+        cache_dir: Path = _CACHE_DIR,
+        ttl: float = _CACHE_TTL_SECONDS,
+    ):
+        self._client = client
+        self._namespace = namespace
+        self._cache_dir = cache_dir
+        self._ttl = ttl
+        self._prune()
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._client, name)
+        if name not in self.CACHED_METHODS:
+            return attr
+        return partial(self._cached_call, name, attr)
+
+    def _prune(self):
+        """Delete expired entries (and temp files left by interrupted runs)."""
+        cutoff = time.time() - self._ttl
+        try:
+            entries = list(os.scandir(self._cache_dir))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                pass
+
+    def _cached_call(self, name: str, method, *args, cache_tag=None, **kwargs):
+        if cache_tag is None:
+            return method(*args, **kwargs)
+
+        raw_key = json.dumps(
+            [self._namespace, name, args, kwargs, cache_tag],
+            sort_keys=True,
+            default=str,
+        )
+        path = self._cache_dir / f"{hashlib.sha1(raw_key.encode()).hexdigest()}.json"
+
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age < self._ttl:
+                with open(path, "rb") as f:
+                    data = orjson.loads(f.read()) if HAS_ORJSON else json.load(f)
+                info(
+                    f"[YouTube] Using cached {name} {' '.join(map(str, args))} "
+                    f"from {age / 60:.0f} min ago (pass --no-cache to refetch)"
+                )
+                return data
+        except (OSError, ValueError):
+            pass
+
+        data = method(*args, **kwargs)
+
+        # Best effort: a cache write failure must never fail the fetch.
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                if HAS_ORJSON:
+                    f.write(orjson.dumps(data))
+                else:
+                    f.write(json.dumps(data).encode("utf-8"))
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError):
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+        return data
+
+
 class YouTubeMusicSource(InputSource):
     def __init__(
         self,
         auth_headers_path: Optional[str] = None,
         playlist_id: Optional[str] = None,
         user: Optional[str] = None,
+        max_workers: int = 8,
+        use_cache: bool = True,
     ):
         self.auth_headers_path = auth_headers_path
         self.playlist_id = playlist_id
         self.user = user
-        self.client: Optional[YTMusic] = None
+        # Concurrent get_playlist calls; lower it if YouTube starts throttling.
+        self.max_workers = max_workers
+        self.use_cache = use_cache
+        self.client: Optional["YTMusic"] = None
+        self._retries = 0
+        self._retries_lock = threading.Lock()
+        # get_playlist responses of the current run, by playlist id: a
+        # playlist listed both by the user and in the library (or requested
+        # explicitly) is only downloaded once, even when both ask at once.
+        self._raw_playlists: Dict[str, Future] = {}
+        self._raw_playlists_lock = threading.Lock()
 
     def authenticate(self):
-        self.client = YTMusic(self.auth_headers_path)
+        client = _client_class()(self.auth_headers_path)
+        if self.use_cache:
+            client = _CachedYTMusic(client, namespace=self.auth_headers_path or "")
+        self.client = client
         info("[YouTube] Client initialized")
 
     # ----------------------------
     # Normalization (pure logic)
     # ----------------------------
 
-    def _normalize_track(self, it: Dict[str, Any]) -> Dict[str, Any]:
-        artists = it.get("artists") or []
-        artist_name = artists[0].get("name") if artists else "Unknown"
-
-        return {
-            "id": it.get("videoId") or it.get("playlistItemId") or 0,
-            "title": it.get("title", ""),
-            "duration": _parse_duration(it.get("length")),
-            "artist": {"id": 0, "name": artist_name},
-            "date_add": None,
-        }
-
     def _normalize_playlist(
         self,
         pl: Dict[str, Any],
@@ -68,43 +348,89 @@ class YouTubeMusicSource(InputSource):
         return {
             "id": pl.get("playlistId"),
             "title": pl.get("title"),
-            "tracks": [self._normalize_track(it) for it in raw_tracks],
-            "creation_date": pl.get("published")
-            or pl.get("publishedAt")
-            or pl.get("lastUpdated")
-            or 0,
+            "tracks": _normalize_tracks_bulk(raw_tracks),
+            "creation_date": _first_value(pl, _PLAYLIST_DATE_KEYS),
         }
 
     # ----------------------------
     # Raw fetchers (API only)
     # ----------------------------
 
+    def _with_retry(self, func, *args, **kwargs):
+        """Call `func`, retrying transient failures with backoff and jitter.
+
+        A throttled response's Retry-After is honored when it asks for longer.
+        """
+        for attempt in range(_RETRY_ATTEMPTS):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if attempt == _RETRY_ATTEMPTS - 1 or not _is_transient(e):
+                    raise
+                retry_after = _retry_after(e)
+            with self._retries_lock:
+                self._retries += 1
+            delay = min(_RETRY_MAX, _RETRY_INITIAL * (2 ** attempt))
+            time.sleep(max(retry_after, delay + random.uniform(0, delay / 2)))
+
     def _fetch_raw_liked_tracks(self) -> List[Dict[str, Any]]:
-        liked = self.client.get_liked_songs(limit=None)
+        liked = self._with_retry(self.client.get_liked_songs, limit=None)
         return liked.get("tracks", [])
 
-    def _fetch_raw_playlist_tracks(self, playlist_id: str) -> List[Dict[str, Any]]:
-        items = self.client.get_playlist(playlist_id, limit=None)
-        return items.get("tracks", [])
+    def _fetch_raw_playlist(
+        self, playlist_id: str, version: Optional[Tuple] = None
+    ) -> Dict[str, Any]:
+        """get_playlist, once per run; only versioned playlists use the disk cache."""
+        kwargs: Dict[str, Any] = {"limit": None}
+        if self.use_cache and version:
+            kwargs["cache_tag"] = version
+
+        with self._raw_playlists_lock:
+            future = self._raw_playlists.get(playlist_id)
+            owner = future is None
+            if owner:
+                future = self._raw_playlists[playlist_id] = Future()
+
+        if owner:
+            try:
+                data = self._with_retry(self.client.get_playlist, playlist_id, **kwargs)
+            except BaseException as e:
+                # Always resolve the shared future (even on KeyboardInterrupt),
+                # or threads waiting on the same playlist would block forever.
+                future.set_exception(e)
+                raise
+            future.set_result(data)
+        return future.result()
+
+    def _fetch_raw_playlist_tracks(self, pl: Dict[str, Any]) -> List[Dict[str, Any]]:
+        version = tuple(pl.get(k) for k in _PLAYLIST_VERSION_KEYS)
+        if not any(version):
+            version = None
+        return self._fetch_raw_playlist(pl.get("playlistId"), version).get(
+            "tracks", []
+        )
 
     def _fetch_raw_library_playlists(self) -> List[Dict[str, Any]]:
-        return self.client.get_library_playlists(limit=50)
+        return self._with_retry(self.client.get_library_playlists, limit=50)
+
+    def _fetch_raw_user_playlists(self) -> Iterator[Dict[str, Any]]:
+        """Yield user playlist metadata as it arrives.
 
-    def _fetch_raw_user_playlists(self) -> List[Dict[str, Any]]:
+        The first page comes with `get_user`; it is yielded before the
+        `params` continuation is requested, so its tracks can start fetching.
+        """
         if not self.user:
-            return []
+            return
 
-        user_info = self.client.get_user(self.user)
+        user_info = self._with_retry(self.client.get_user, self.user)
         result = user_info.get("playlists", {})
-        playlists = result.get("results", [])
-        params = result.get("params")
+        yield from result.get("results", [])
 
+        params = result.get("params")
         if params:
-            playlists.extend(
-                self.client.get_user_playlists(self.user, params).get("results", [])
-            )
-
-        return playlists
+            yield from self._with_retry(
+                self.client.get_user_playlists, self.user, params
+            ).get("results", [])
 
     # ----------------------------
     # Orchestrators (IO + logging)
@@ -113,23 +439,21 @@ class YouTubeMusicSource(InputSource):
     def _fetch_liked_tracks(self) -> List[Dict[str, Any]]:
         try:
             raw_tracks = self._fetch_raw_liked_tracks()
-            return [self._normalize_track(it) for it in raw_tracks]
+            return _normalize_tracks_bulk(raw_tracks)
         except Exception as e:
             warn(f"Failed to fetch liked songs: {e}")
             return []
 
     def _fetch_playlist(self, playlist_id: str) -> Optional[Dict[str, Any]]:
         try:
-            items = self.client.get_playlist(playlist_id, limit=None)
+            items = self._fetch_raw_playlist(playlist_id)
             raw_tracks = items.get("tracks", [])
 
             playlist = {
                 "id": playlist_id,
                 "title": items.get("title", ""),
-                "tracks": [self._normalize_track(it) for it in raw_tracks],
-                "creation_date": items.get("published")
-                or items.get("publishedAt")
-                or 0,
+                "tracks": _normalize_tracks_bulk(raw_tracks),
+                "creation_date": _first_value(items, _PLAYLIST_DATE_KEYS),
             }
 
             info(
@@ -142,70 +466,121 @@ class YouTubeMusicSource(InputSource):
             warn(f"Failed to fetch playlist {playlist_id}: {e}")
             return None
 
-    def _fetch_library_playlists(self) -> List[Dict[str, Any]]:
-        out = []
+    def _fetch_requested_playlist(self) -> List[Dict[str, Any]]:
+        playlist = self._fetch_playlist(self.playlist_id)
+        return [playlist] if playlist else []
 
+    def _fetch_library_playlists(
+        self, seen_ids: Optional[Set[str]] = None
+    ) -> List[Dict[str, Any]]:
         try:
             playlists = self._fetch_raw_library_playlists()
             info(f"[YouTube] Found {len(playlists)} library playlists")
         except Exception as e:
             warn(f"Failed to fetch library playlists: {e}")
-            return out
+            return []
 
-        for pl in playlists:
-            pl_id = pl.get("playlistId")
-            pl_title = pl.get("title")
+        # Skip playlists already fetched elsewhere in this run.
+        if seen_ids:
+            playlists = [
+                pl for pl in playlists if pl.get("playlistId") not in seen_ids
+            ]
 
+        return self._fetch_playlists_tracks(playlists, "Library")
+
+    def _fetch_user_playlists(self) -> List[Dict[str, Any]]:
+        return self._fetch_playlists_tracks(self._fetch_raw_user_playlists(), "User")
+
+    def _fetch_playlists_tracks(
+        self, playlists: Iterable[Dict[str, Any]], kind: str
+    ) -> List[Dict[str, Any]]:
+        """Fetch and normalize the tracks of each playlist, in input order.
+
+        Each get_playlist is a network round trip: they are all dispatched to
+        the worker pool, each one as soon as its metadata is pulled from
+        `playlists` (which may itself still be paging). Results (and log
+        lines) are collected from the calling thread only, so output never
+        interleaves.
+        """
+        result = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = []
             try:
-                raw_tracks = self._fetch_raw_playlist_tracks(pl_id)
-                playlist = self._normalize_playlist(pl, raw_tracks)
-                info(
-                    f"[YouTube] Library playlist '{pl_title}' ({pl_id}): "
-                    f"{len(playlist['tracks'])} tracks fetched"
-                )
+                for pl in playlists:
+                    futures.append(
+                        (
+                            pl,
+                            executor.submit(self._fetch_raw_playlist_tracks, pl),
+                        )
+                    )
             except Exception as e:
-                warn(f"Failed to fetch library playlist '{pl_title}': {e}")
-                playlist = self._normalize_playlist(pl, [])
+                # Keep whatever metadata arrived before the failure.
+                warn(f"Failed to fetch {kind.lower()} playlists metadata: {e}")
+
+            for pl, future in futures:
+                pl_id = pl.get("playlistId")
+                pl_title = pl.get("title")
+
+                try:
+                    raw_tracks = future.result()
+                    playlist = self._normalize_playlist(pl, raw_tracks)
+                    info(
+                        f"[YouTube] {kind} playlist '{pl_title}' ({pl_id}): "
+                        f"{len(playlist['tracks'])} tracks fetched"
+                    )
+                except Exception as e:
+                    warn(f"Failed to fetch {kind.lower()} playlist '{pl_title}': {e}")
+                    playlist = self._normalize_playlist(pl, [])
+
+                result.append(playlist)
 
-            out.append(playlist)
+        return result
 
-        return out
+    # ----------------------------
+    # Public API
+    # ----------------------------
 
-    def _fetch_user_playlists(self) -> List[Dict[str, Any]]:
-        out = []
+    def _end_run(self):
+        self._raw_playlists.clear()
+        if self._retries:
+            info(f"[YouTube] {self._retries} request(s) retried after transient errors")
 
-        try:
-            playlists = self._fetch_raw_user_playlists()
-        except Exception as e:
-            warn(f"Failed to fetch user playlists metadata: {e}")
-            return out
+    def _stages(self) -> List[Tuple[str, Any]]:
+        """`(result key, fetcher)` pairs for this run, in output order.
 
-        for pl in playlists:
-            pl_id = pl.get("playlistId")
-            pl_title = pl.get("title")
+        Each fetcher returns a list and is independent of the others.
+        """
+        stages: List[Tuple[str, Any]] = []
+        seen_ids: Set[str] = set()
 
-            try:
-                raw_tracks = self._fetch_raw_playlist_tracks(pl_id)
-                playlist = self._normalize_playlist(pl, raw_tracks)
-                info(
-                    f"[YouTube] User playlist '{pl_title}' ({pl_id}): "
-                    f"{len(playlist['tracks'])} tracks fetched"
-                )
-            except Exception as e:
-                warn(f"Failed to fetch user playlist '{pl_title}': {e}")
-                playlist = self._normalize_playlist(pl, [])
+        if self.playlist_id:
+            seen_ids.add(self.playlist_id)
+            stages.append(("user_playlists", self._fetch_requested_playlist))
 
-            out.append(playlist)
+        stages.append(("user_playlists", self._fetch_user_playlists))
 
-        return out
+        if self.auth_headers_path:
+            stages.append(("tracks", self._fetch_liked_tracks))
+            # Liked songs are also listed as a library playlist.
+            seen_ids.add(_LIKED_SONGS_PLAYLIST_ID)
+            stages.append(
+                ("user_playlists", partial(self._fetch_library_playlists, seen_ids))
+            )
 
-    # ----------------------------
-    # Public API
-    # ----------------------------
+        return stages
 
     def fetch_data(self) -> Dict[str, Any]:
+        """Fetch everything at once.
+
+        The stages (explicit playlist, user playlists, liked songs, library
+        playlists) are independent: each one runs on its own thread (on top
+        of the per-playlist pool inside the stage), so the total wait is the
+        slowest stage rather than their sum.
+        """
         if self.client is None:
             self.authenticate()
+        self._raw_playlists.clear()
+        self._retries = 0
 
         result = {
             "tracks": [],
@@ -214,15 +589,21 @@ class YouTubeMusicSource(InputSource):
             "user_playlists": [],
         }
 
-        if self.playlist_id:
-            pl = self._fetch_playlist(self.playlist_id)
-            if pl:
-                result["user_playlists"].append(pl)
-
-        result["user_playlists"].extend(self._fetch_user_playlists())
-
-        if self.auth_headers_path:
-            result["tracks"] = self._fetch_liked_tracks()
-            result["user_playlists"].extend(self._fetch_library_playlists())
-
+        stages = self._stages()
+        with ThreadPoolExecutor(max_workers=len(stages)) as top:
+            futures = [(key, top.submit(fetch)) for key, fetch in stages]
+            for key, future in futures:
+                result[key].extend(future.result())
+
+        # A playlist listed by several stages is kept once, at its first
+        # position (requested playlist, then user, then library).
+        playlists = []
+        seen_ids: Set[str] = set()
+        for pl in result["user_playlists"]:
+            if pl["id"] not in seen_ids:
+                seen_ids.add(pl["id"])
+                playlists.append(pl)
+        result["user_playlists"] = playlists
+
+        self._end_run()
         return result
@@ -6,35 +6,42 @@ Usage examples:
   python -m musixporter.tools.tidal_search --missed missed_tidal.json
 """
 import argparse
-import json
 import difflib
-from musixporter.converters.tidal_mapper import TidalMapper
+import json
+from typing import TYPE_CHECKING
+
+# TidalMapper (minim, requests) and orjson are imported on first use, so
+# `--help` and usage errors return without loading them.
+if TYPE_CHECKING:
+    from musixporter.converters.tidal_mapper import TidalMapper
 
 
-def clean(s, tm: TidalMapper):
+def clean(s, tm: "TidalMapper"):
     return tm._clean_str(s or "")
 
 
-def print_candidate(i, item, clean_title, tm: TidalMapper):
+def print_candidate(i, item, cleaned, tm: "TidalMapper"):
     title = item.get("title")
-    cand = tm._clean_str(title)
-    score = difflib.SequenceMatcher(None, clean_title, cand).ratio()
+    # Same metric and argument order as the mapper's title score.
+    score = difflib.SequenceMatcher(None, cleaned, tm._clean_str(title)).ratio()
     dur = item.get("duration", 0)
-    artists = []
-    if "artists" in item and isinstance(item["artists"], list):
-        for a in item["artists"]:
-            if isinstance(a, dict):
-                artists.append(a.get("name", ""))
-            else:
-                artists.append(str(a))
-    elif "artist" in item and isinstance(item["artist"], dict):
-        artists.append(item["artist"].get("name", ""))
+    arts = item.get("artists")
+    if isinstance(arts, list):
+        artists = [a.get("name", "") if isinstance(a, dict) else str(a) for a in arts]
+    else:
+        a = item.get("artist")
+        artists = [a.get("name", "")] if isinstance(a, dict) else []
 
     print(f"[{i}] id={item.get('id')} title={title!r} artists={artists} dur={dur} score={score:.2f}")
 
 
-def search_one(tm: TidalMapper, source_track: dict):
-    print("\n=== Searching for: {} — {} ===".format(source_track.get('title'), tm._get_safe_artist(source_track)[0]))
+def search_one(tm: "TidalMapper", source_track: dict):
+    title = source_track.get('title') or ''
+    artist = tm._get_safe_artist(source_track)[0]
+    cleaned = clean(title, tm)
+    cleaned_artist = tm._clean_str(artist)
+
+    print("\n=== Searching for: {} — {} ===".format(source_track.get('title'), artist))
 
     # Approach ISRC
     isrc = source_track.get("isrc")
@@ -47,22 +54,19 @@ def search_one(tm: TidalMapper, source_track: dict):
     print("Approach: Artist+Title (fuzzy)")
     res = tm._approach_artist_title(source_track, silent=True)
     if res:
-        clean_title = clean(source_track.get('title') or '', tm)
-        cand = tm._clean_str(res.get('title') or '')
-        score = difflib.SequenceMatcher(None, clean_title, cand).ratio()
+        score = difflib.SequenceMatcher(
+            None, cleaned, tm._clean_str(res.get('title') or '')
+        ).ratio()
         print(f"  Best fuzzy match: {res.get('id')} {res.get('title')!r} (score={score:.2f})")
     else:
         print("  No fuzzy match accepted")
 
     # Raw queries and top candidates
-    title = source_track.get('title') or ''
-    artist = tm._get_safe_artist(source_track)[0]
-    cleaned = clean(title, tm)
-    queries = [f"{cleaned} {tm._clean_str(artist)}", cleaned]
+    queries = [f"{cleaned} {cleaned_artist}", cleaned]
 
     for q in queries:
         print('\nQuery:', q)
-        data = tm._search_tidal(q, types='TRACKS', limit=8)
+        data = tm._search_tidal(q, type="track", limit=8)
         items = data.get('tracks', {}).get('items', [])
         if not items:
             print('  No results')
@@ -81,14 +85,24 @@ def main():
     p.add_argument('--country', help='Country code override (default FR)')
     args = p.parse_args()
 
+    from musixporter.converters.tidal_mapper import TidalMapper
+
     tm = TidalMapper()
     if args.country:
         tm.country_code = args.country
     tm._authenticate()
 
     if args.missed:
-        with open(args.missed, 'r', encoding='utf-8') as f:
-            missed = json.load(f)
+        try:
+            import orjson
+        except Exception:
+            orjson = None
+        if orjson is not None:
+            with open(args.missed, 'rb') as f:
+                missed = orjson.loads(f.read())
+        else:
+            with open(args.missed, 'r', encoding='utf-8') as f:
+                missed = json.load(f)
         for m in missed:
             orig = m.get('original') or {}
             search_one(tm, orig)
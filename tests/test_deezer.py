@@ -0,0 +1,102 @@
+import os
+import unittest
+from unittest import mock
+
+import httpx
+
+from musixporter.sources import deezer as deezer_source
+from musixporter.sources.deezer import DeezerUserSource, _RateLimitedTransport
+
+_URL = httpx.URL("https://api.deezer.com/user/5")
+
+
+class RateLimitedTransportTest(unittest.TestCase):
+    def test_default_transport_is_rate_limited(self):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            source = DeezerUserSource(user_id="5")
+        self.addCleanup(source.close)
+
+        transport = source.client._transport_for_url(_URL)
+        self.assertIsInstance(transport, _RateLimitedTransport)
+
+    def test_proxied_transport_is_rate_limited(self):
+        with mock.patch.dict(
+            os.environ, {"HTTPS_PROXY": "http://127.0.0.1:9"}, clear=True
+        ):
+            source = DeezerUserSource(user_id="5")
+        self.addCleanup(source.close)
+
+        transport = source.client._transport_for_url(_URL)
+        self.assertIsInstance(transport, _RateLimitedTransport)
+        self.assertIsInstance(transport._transport, httpx.HTTPTransport)
+        self.assertIsNot(transport._transport, source.client._transport._transport)
+
+    def test_proxied_requests_wait_for_quota_and_retry(self):
+        with mock.patch.dict(
+            os.environ, {"HTTPS_PROXY": "http://127.0.0.1:9"}, clear=True
+        ):
+            source = DeezerUserSource(user_id="5")
+        self.addCleanup(source.close)
+
+        statuses = iter([429, 200])
+        inner = httpx.MockTransport(
+            lambda request: httpx.Response(next(statuses), json={"id": 5})
+        )
+        wait = mock.Mock()
+        transport = source.client._transport_for_url(_URL)
+        transport._transport = inner
+        transport._wait_for_quota = wait
+
+        with mock.patch.object(deezer_source.time, "sleep"):
+            # deezer.Client.request parses resources: go below it.
+            response = httpx.Client.request(source.client, "GET", "/user/5")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"id": 5})
+        self.assertEqual(wait.call_count, 2)
+
+
+class FetchPagesTest(unittest.TestCase):
+    def _source(self, handler):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            source = DeezerUserSource(user_id="5")
+        self.addCleanup(source.close)
+        source.client._transport._transport = httpx.MockTransport(handler)
+        source.client._transport._wait_for_quota = mock.Mock()
+        return source
+
+    @staticmethod
+    def _page(request, total, missing=()):
+        index = int(request.url.params.get("index", 0))
+        limit = int(request.url.params["limit"])
+        ids = [i for i in range(index, min(index + limit, total)) if i not in missing]
+        body = {
+            "data": [{"id": i, "type": "track"} for i in ids],
+            "total": total,
+        }
+        if index + limit < total:
+            body["next"] = (
+                f"https://api.deezer.com{request.url.path}"
+                f"?limit={limit}&index={index + limit}"
+            )
+        return httpx.Response(200, json=body)
+
+    def test_short_first_page_does_not_duplicate(self):
+        # Deezer drops unavailable tracks from a page but still counts them.
+        source = self._source(lambda r: self._page(r, 150, missing={3, 42}))
+
+        ids = source._fetch_pages("user/5/tracks", "id,type", lambda t: t.id)
+
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(set(ids), set(range(150)) - {3, 42})
+
+    def test_single_page(self):
+        source = self._source(lambda r: self._page(r, 7))
+
+        ids = source._fetch_pages("user/5/tracks", "id,type", lambda t: t.id)
+
+        self.assertEqual(ids, list(range(7)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from unittest import mock
+
+from ytmusicapi import YTMusic
+from ytmusicapi.exceptions import YTMusicServerError
+
+from musixporter.sources.ytmusic import _client_class, _is_transient
+
+
+def _response(status_code, body, headers=None):
+    response = mock.Mock()
+    response.status_code = status_code
+    response.reason = "Reason"
+    response.text = body.decode("utf-8")
+    response.content = body
+    response.headers = headers or {}
+    return response
+
+
+class ClientParityTest(unittest.TestCase):
+    """_client_class() overrides a private ytmusicapi method: keep it in step."""
+
+    def _send(self, cls, response):
+        client = cls()
+        # base_headers would otherwise fetch the YouTube Music home page.
+        client.__dict__["base_headers"] = {}
+        client._session.post = mock.Mock(return_value=response)
+        try:
+            result = client._send_request("browse", {"browseId": "VLPL1"}, "&x=1")
+        except YTMusicServerError as e:
+            result = e
+        return client._session.post.call_args, result
+
+    def test_same_request_and_result(self):
+        response = _response(200, b'{"contents": {"a": [1, 2]}}')
+
+        upstream = self._send(YTMusic, response)
+        ours = self._send(_client_class(), response)
+
+        self.assertEqual(ours, upstream)
+
+    def test_same_error_plus_status(self):
+        response = _response(
+            429, b'{"error": {"message": "slow down"}}', {"Retry-After": "7"}
+        )
+
+        upstream_call, upstream_exc = self._send(YTMusic, response)
+        ours_call, ours_exc = self._send(_client_class(), response)
+
+        self.assertEqual(ours_call, upstream_call)
+        self.assertIs(type(ours_exc), type(upstream_exc))
+        self.assertEqual(str(ours_exc), str(upstream_exc))
+        self.assertEqual(ours_exc.status_code, 429)
+        self.assertEqual(ours_exc.retry_after, "7")
+        self.assertTrue(_is_transient(ours_exc))
+        self.assertTrue(_is_transient(upstream_exc))
+
+
+if __name__ == "__main__":
+    unittest.main()